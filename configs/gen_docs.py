@@ -6,7 +6,7 @@ sys.path.append(
 )
 from megatron.neox_arguments import neox_args, deepspeed_args
 from inspect import getmembers, getsource
-from dataclasses import field, is_dataclass
+from dataclasses import field, is_dataclass, MISSING
 from itertools import tee, zip_longest
 import pathlib
 
@@ -36,6 +36,8 @@ def get_docs(module):
                 field_type = str(field_type)
 
             field_default = field_def.default
+            if field_def.default_factory is not MISSING:
+                field_default = field_def.default_factory()
 
             # try to find the field definition
             loc = src.find(f" {field_name}:", loc + len(field_name) + 1)
@@ -8,14 +8,10 @@ import torch
 import argparse
 import shutil
 
-from dataclasses import dataclass
-from typing import List, Dict
+from dataclasses import dataclass, MISSING
+from typing import Any, List, Dict
 from socket import gethostname
 
-try:
-    from typing import Literal
-except ImportError:
-    from typing_extensions import Literal
 from deepspeed.launcher.runner import DLTS_HOSTFILE
 from megatron.logging import Tee
 from megatron.tokenizer import build_tokenizer
@@ -32,6 +28,7 @@ from .neox_args import (
     NeoXArgsOptimizer,
     NeoXArgsLRScheduler,
     ATTENTION_TYPE_CHOICES,
+    get_or_empty,
 )
 
 # ZERO defaults by deespeed
@@ -181,7 +178,7 @@ class NeoXArgs(*BASE_CLASSES):
         
         # Configuration parameters not specified
         params_not_in_config = sorted(
-            list(set(cls.__dataclass_fields__.keys()) - set(config.keys()))
+            list(cls.field_names() - set(config.keys()))
         )
         if len(params_not_in_config) > 0:
             logging.debug(
@@ -482,9 +479,10 @@ class NeoXArgs(*BASE_CLASSES):
                 # add info 'default or updated'
                 field_def = self.__dataclass_fields__.get(arg)
                 if field_def is not None:
-                    default_info = (
-                        "default" if value == field_def.default else "updated"
-                    )
+                    default_value = field_def.default
+                    if field_def.default_factory is not MISSING:
+                        default_value = field_def.default_factory()
+                    default_info = "default" if value == default_value else "updated"
                 else:
                     default_info = ""
                 dots = "." * (64 - len(print_str))
@@ -673,9 +671,10 @@ class NeoXArgs(*BASE_CLASSES):
         )
 
         # derive precision
-        if (self.fp16 or {}).get("type", self.precision) == "bfloat16":
+        fp16 = get_or_empty(self.fp16)
+        if fp16.get("type", self.precision) == "bfloat16":
             self.update_value("precision", "bfloat16")
-        elif (self.fp16 or {}).get("enabled", False):
+        elif fp16.get("enabled", False):
             self.update_value("precision", "fp16")
         else:
             self.update_value("precision", "fp32")
@@ -937,12 +936,16 @@ class NeoXArgs(*BASE_CLASSES):
         """
         At runtime, checks types are actually the type specified.
         """
+        field_choices = self.field_choices()
         for field_name, field_def in self.__dataclass_fields__.items():
 
             actual_value = getattr(self, field_name)
             if actual_value is None:
                 continue  # we allow for some values not to be configured
 
+            if field_def.type is Any:
+                continue  # runtime objects (e.g. tokenizer) are not type checked
+
             actual_type = type(actual_value)
             if actual_type != field_def.type:
                 if (
@@ -951,21 +954,18 @@ class NeoXArgs(*BASE_CLASSES):
                     continue
 
                 # for typing.Literal (i.e a list of choices) - checks that actual value is in accepted values
-                elif field_def.type.__origin__ == Literal:
-                    accepted_values = field_def.type.__args__
+                elif field_name in field_choices:
+                    accepted_values = field_choices[field_name]
                     if actual_value in accepted_values:
                         continue
                     elif type(actual_value) == str:
                         # case insensitive checking
-                        lowercase_accepted_values = [
-                            i.lower() for i in accepted_values if isinstance(i, str)
-                        ]
-                        if actual_value.lower() in lowercase_accepted_values:
+                        if actual_value.lower() in accepted_values:
                             continue
                     logging.error(
                         self.__class__.__name__
                         + ".validate_types() "
-                        + f"{field_name}: '{actual_value}' Not in accepted values: '{accepted_values}'"
+                        + f"{field_name}: '{actual_value}' Not in accepted values: '{field_def.type.__args__}'"
                     )
                     return False
 
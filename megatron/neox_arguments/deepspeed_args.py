@@ -1,9 +1,6 @@
 from dataclasses import dataclass
 
-try:
-    from .template import NeoXArgsTemplate
-except ImportError:
-    from template import NeoXArgsTemplate
+from .template import NeoXArgsTemplate
 
 
 @dataclass
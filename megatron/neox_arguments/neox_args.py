@@ -1,36 +1,119 @@
-import subprocess
-from dataclasses import dataclass
+import os
+import sys
+import types
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Mapping
 
-try:
-    from .template import NeoXArgsTemplate
-except ImportError:
-    from template import NeoXArgsTemplate
+from .template import NeoXArgsTemplate
 
-try:
+if sys.version_info >= (3, 8):
     from typing import Literal
-except ImportError:
+else:
     from typing_extensions import Literal
 
-ATTENTION_TYPE_CHOICES = [
-    "global",
-    "local",
-    "sparse_fixed",
-    "sparse_variable",
-    "bigbird",
-    "bslongformer",
-    "gmlp",
-    "amlp",
+# NOTE: this module must stay plain (uncompiled) python - configs/gen_docs.py extracts the
+# attribute docstrings below via inspect.getsource, which does not work on extension modules.
+
+ATTENTION_TYPE_CHOICES = frozenset(
+    {
+        "global",
+        "local",
+        "sparse_fixed",
+        "sparse_variable",
+        "bigbird",
+        "bslongformer",
+        "gmlp",
+        "amlp",
+    }
+)
+
+# choices shared by init_method and output_layer_init_method
+InitMethod = Literal[
+    "normal",
+    "scaled_normal",
+    "orthogonal",
+    "scaled_orthogonal",
+    "xavier_uniform",
+    "xavier_normal",
+    "wang_init",
+    "small_init",
 ]
 
+# shared read-only empty containers, used in place of allocating a fresh {} / [] for unset (None) config values
+_EMPTY_DICT: Mapping = types.MappingProxyType({})
+_EMPTY_TUPLE: tuple = ()
 
+
+def get_or_empty(value, kind=dict):
+    """
+    Returns value, or a shared read-only empty container if value is None.
+
+    kind selects the sentinel: dict returns an empty mapping, list (or tuple) returns an empty tuple.
+    The sentinel must not be stored back on the args, as it is shared and not json serializable.
+    """
+    if value is not None:
+        return value
+    if kind is dict:
+        return _EMPTY_DICT
+    if kind in (list, tuple):
+        return _EMPTY_TUPLE
+    raise ValueError(f"get_or_empty() unsupported kind: {kind}")
+
+
+def _read_git_head(repo_root):
+    """
+    Reads the abbreviated commit hash of HEAD straight from the .git directory in repo_root.
+
+    Returns None if it cannot be resolved this way (e.g. worktrees and submodules, where .git is a file).
+    """
+    git_dir = os.path.join(repo_root, ".git")
+    if not os.path.isdir(git_dir):
+        return None
+    try:
+        with open(os.path.join(git_dir, "HEAD")) as f:
+            head = f.read().strip()
+        if not head.startswith("ref: "):
+            # detached HEAD contains the commit hash itself
+            return head[:7] or None
+        ref = head[len("ref: ") :]
+        ref_path = os.path.join(git_dir, ref)
+        if os.path.isfile(ref_path):
+            with open(ref_path) as f:
+                return f.read().strip()[:7] or None
+        # the ref may only be listed in packed-refs
+        with open(os.path.join(git_dir, "packed-refs")) as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) == 2 and parts[1] == ref:
+                    return parts[0][:7]
+    except OSError:
+        pass
+    return None
+
+
+@lru_cache(maxsize=1)
 def get_git_commit_hash():
     """ Gets the git commit hash of your current repo (if it exists) """
+    git_hash = _read_git_head(os.getcwd())
+    if git_hash is not None:
+        return git_hash
+
+    # fall back to asking git itself
+    import subprocess
+
     try:
-        git_hash = subprocess.check_output(["git", "describe", "--always"]).strip()
-        git_hash = git_hash.decode()
-    except subprocess.CalledProcessError:
-        git_hash = None
-    return git_hash
+        result = subprocess.run(
+            ["git", "describe", "--always"],
+            capture_output=True,
+            check=False,
+            text=True,
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError, OSError):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip()
 
 
 @dataclass
@@ -267,31 +350,13 @@ class NeoXArgsModel(NeoXArgsTemplate):
     Base for rotary positional embedding
     """
 
-    init_method: Literal[
-        "normal",
-        "scaled_normal",
-        "orthogonal",
-        "scaled_orthogonal",
-        "xavier_uniform",
-        "xavier_normal",
-        "wang_init",
-        "small_init",
-    ] = "normal"
+    init_method: InitMethod = "normal"
     """
     Init function used on all layers except ff residual outputs - choose from 
     ["normal", "scaled_normal", "orthogonal", "scaled_orthogonal", "xavier_uniform", "xavier_normal", "wang_init", "small_init"]
     """
 
-    output_layer_init_method: Literal[
-        "normal",
-        "scaled_normal",
-        "orthogonal",
-        "scaled_orthogonal",
-        "xavier_uniform",
-        "xavier_normal",
-        "wang_init",
-        "small_init",
-    ] = "scaled_normal"
+    output_layer_init_method: InitMethod = "scaled_normal"
     """
     Init function used for ff residual outputs - choose from 
     ["normal", "scaled_normal", "orthogonal", "scaled_orthogonal", "xavier_uniform", "xavier_normal", "wang_init", "small_init"]
@@ -438,7 +503,7 @@ class NeoXArgsLogging(NeoXArgsTemplate):
     wandb_host: str = "https://api.wandb.ai"
     """url of the wandb host"""
 
-    git_hash: str = get_git_commit_hash()
+    git_hash: str = field(default_factory=get_git_commit_hash)
     """current git hash of repository"""
 
     log_dir: str = None
@@ -446,7 +511,7 @@ class NeoXArgsLogging(NeoXArgsTemplate):
     Directory to save logs to.
     """
 
-    tensorboard_writer = None
+    tensorboard_writer: Any = None
     """
     initialized tensorboard writer
     """
@@ -535,7 +600,7 @@ class NeoXArgsOther(NeoXArgsTemplate):
     Enable auto-resume on adlr cluster.
     """
 
-    adlr_autoresume_object = None
+    adlr_autoresume_object: Any = None
     """
     imported autoresume
     """
@@ -618,7 +683,7 @@ class NeoXArgsTokenizer(NeoXArgsTemplate):
     as it's dependent on the parallelism size.
     """
 
-    tokenizer = None
+    tokenizer: Any = None
     """
     tokenizer object loaded into memory and accesible by other functions
     """
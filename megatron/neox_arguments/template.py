@@ -1,15 +1,56 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, MISSING
+from functools import lru_cache
 import logging 
+import sys
 
+if sys.version_info >= (3, 8):
+    from typing import Literal
+else:
+    from typing_extensions import Literal
+
+# The argument dataclasses intentionally do not use __slots__ (dataclass(slots=True), or
+# attrs with slots=True). NeoXArgs inherits from all of them at once, and multiple slotted
+# bases cause an instance lay-out conflict. NeoXArgs also relies on being able to set
+# undefined attributes, and the codebase introspects them via __dataclass_fields__.
 @dataclass
 class NeoXArgsTemplate:
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def field_names(cls) -> frozenset:
+        """
+        frozenset of the dataclass field names of this class, computed once per class.
+
+        This is cached lazily rather than in __init_subclass__, which runs before @dataclass has collected the fields.
+        """
+        return frozenset(cls.__dataclass_fields__)
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def field_choices(cls) -> dict:
+        """
+        maps the name of each typing.Literal field to a frozenset of its accepted values, computed once per class.
+
+        Lowercased versions of string choices are included so that case insensitive checks are a single lookup.
+        """
+        choices = dict()
+        for field_name, field_def in cls.__dataclass_fields__.items():
+            if getattr(field_def.type, "__origin__", None) == Literal:
+                accepted_values = field_def.type.__args__
+                choices[field_name] = frozenset(accepted_values) | frozenset(
+                    i.lower() for i in accepted_values if isinstance(i, str)
+                )
+        return choices
+
     def defaults(self):
         """
         generator for getting default values.
         """
         for key, field_def in self.__dataclass_fields__.items():
-            yield key, field_def.default
+            if field_def.default_factory is not MISSING:
+                yield key, field_def.default_factory()
+            else:
+                yield key, field_def.default
     
     def update_value(self, key: str, value):
         """